@@ -153,6 +153,8 @@ class ExplicitComponent(Component):
         recurse : bool
             If True, setup jacobians in all descendants. (ignored)
         """
+        self._debug_cache = None
+
         if self._has_approx and self._use_derivatives:
             self._set_approx_partials_meta()
 
@@ -238,6 +238,9 @@ class System(object):
     _subjacs_info : dict of dict
         Sub-jacobian metadata for each (output, input) pair added using
         declare_partials. Members of each pair may be glob patterns.
+    _debug_cache : dict or None
+        Jacobian and approximation info used by debugging functions like tree(). It's computed
+        on demand and reset whenever jacobians are set up.
     _design_vars : dict of dict
         dict of all driver design vars added to the system.
     _responses : dict of dict
@@ -412,6 +415,7 @@ class System(object):
         self._jacobian = None
         self._approx_schemes = OrderedDict()
         self._subjacs_info = {}
+        self._debug_cache = None
         self.matrix_free = False
 
         self._owns_approx_jac = False
@@ -1884,6 +1888,8 @@ class System(object):
         recurse : bool
             If True, setup jacobians in all descendants.
         """
+        self._debug_cache = None
+
         if not self._use_derivatives:
             return
 
@@ -2321,6 +2327,7 @@ class System(object):
         Set this system's nonlinear solver.
         """
         self._nonlinear_solver = solver
+        self._debug_cache = None
 
     @property
     def linear_solver(self):
@@ -4,6 +4,7 @@ from __future__ import print_function
 
 import sys
 import os
+import weakref
 from itertools import product, chain
 
 import numpy as np
@@ -52,27 +53,30 @@ def dump_dist_idxs(problem, vec_name='nonlinear', stream=sys.stdout):  # pragma:
     def _get_data(g, type_):
 
         sizes = g._var_sizes[vec_name][type_]
-        vnames = g._var_allprocs_abs_names
-        abs2meta = g._var_allprocs_abs2meta
-        relevant = g._var_relevant_names[vec_name][type_]
+        names = g._var_allprocs_abs_names[type_]
         abs2idx = g._var_allprocs_abs2idx[vec_name]
 
-        idx = 0
-        data = []
-        nwid = 0
-        iwid = 0
-        total = 0
-        for rank in range(g.comm.size):
-            for vname in vnames[type_]:
-                if vname not in abs2idx:
-                    continue
-                ivar = abs2idx[vname]
-                sz = sizes[rank, ivar]
-                if sz > 0:
-                    data.append((vname, str(total)))
-                    nwid = max(nwid, len(vname))
-                    iwid = max(iwid, len(data[-1][1]))
-                    total += sz
+        # variable indices for all names in one pass, with -1 for vars not in this vector
+        ivars = np.fromiter((abs2idx.get(vname, -1) for vname in names), dtype=np.intp,
+                            count=len(names))
+        mask = ivars >= 0
+        if not mask.all():
+            names = [vname for vname, m in zip(names, mask) if m]
+            ivars = ivars[mask]
+
+        # nonzero returns (rank, var) pairs in rank major order, which is the order
+        # of the entries in the distributed vector.
+        var_sizes = sizes[:, ivars]
+        rows, cols = np.nonzero(var_sizes > 0)
+        nz_sizes = var_sizes[rows, cols]
+        offsets = np.cumsum(nz_sizes) - nz_sizes
+
+        data = [(names[c], str(off)) for c, off in zip(cols, offsets)]
+        if data:
+            nwid = max(len(names[c]) for c in set(cols))
+            iwid = len(data[-1][1])  # offsets are increasing
+        else:
+            nwid = iwid = 0
 
         return data, nwid, iwid
 
@@ -81,16 +85,15 @@ def dump_dist_idxs(problem, vec_name='nonlinear', stream=sys.stdout):  # pragma:
         pdata, pnwid, piwid = _get_data(g, 'input')
         udata, unwid, uiwid = _get_data(g, 'output')
 
-        data = []
-        for u, p in zip_longest(udata, pdata, fillvalue=('', '')):
-            data.append((u[0], u[1], p[1], p[0]))
+        # highest offsets are displayed first
+        data = list(zip_longest(udata, pdata, fillvalue=('', '')))
+        data.reverse()
 
-        template = "{0:<{wid0}} {1:>{wid1}}     {2:>{wid2}} {3:<{wid3}}\n"
-        for d in data[::-1]:
-            stream.write(template.format(d[0], d[1], d[2], d[3],
-                                         wid0=unwid, wid1=uiwid,
-                                         wid2=piwid, wid3=pnwid))
-        stream.write("\n\n")
+        template = "{{0:<{0}}} {{1:>{1}}}     {{2:>{2}}} {{3:<{3}}}\n".format(unwid, uiwid,
+                                                                         piwid, pnwid)
+        lines = [template.format(u[0], u[1], p[1], p[0]) for u, p in data]
+        lines.append("\n\n")
+        stream.write(''.join(lines))
 
     if not MPI or MPI.COMM_WORLD.rank == 0:
         _dump(problem.model, stream)
@@ -113,6 +116,7 @@ def _get_color_printer(stream=sys.stdout, colors=True, rank=0):
         init(autoreset=True)
     except ImportError:
         Fore = Back = Style = _NoColor()
+        colors = False
 
     if not colors:
         Fore = Back = Style = _NoColor()
@@ -125,17 +129,89 @@ def _get_color_printer(stream=sys.stdout, colors=True, rank=0):
             sys.exit()
         def color_print(s, **kwargs):
             pass
+    elif colors:
+        reset = Style.RESET_ALL
+
+        def color_print(s, color='', end=''):
+            """
+            """
+            stream.write(''.join((color, s, reset, end)))
     else:
         def color_print(s, color='', end=''):
             """
             """
-            print(color + s, file=stream, end='')
-            print(Style.RESET_ALL, file=stream, end='')
-            print(end=end)
+            stream.write(s)
+            if end:
+                stream.write(end)
 
     return color_print, Fore, Back, Style
 
 
+def _get_debug_info(s, jacs=True, approx=True):
+    """
+    Return jacobian and approximation info for the given System, computing it if necessary.
+
+    The info is cached on the System and is reset whenever its jacobians are set up.  Each
+    part is only computed the first time it's requested.
+
+    Parameters
+    ----------
+    s : System
+        The System being inspected.
+    jacs : bool
+        If True, make sure the assembled jacobian info is available.
+    approx : bool
+        If True, make sure the approximation info is available.
+
+    Returns
+    -------
+    dict
+        May contain 'jacs', a list of the (label, type name) of each assembled jacobian, and
+        'approx', which is None if the System doesn't approximate any derivatives, otherwise
+        a tuple of the approximation scheme names and the number of approximated and
+        total subjacs.
+    """
+    info = s._debug_cache
+    if info is None:
+        s._debug_cache = info = {}
+
+    if jacs and 'jacs' not in info:
+        jaclist = []
+        lnjac = nljac = None
+        if s._assembled_jac is not None:
+            lnjac = s._assembled_jac
+            jaclist.append(lnjac)
+        if s.nonlinear_solver is not None:
+            jacsolvers = list(s.nonlinear_solver._assembled_jac_solver_iter())
+            if jacsolvers:
+                nljac = jacsolvers[0]._assembled_jac
+                if nljac is not lnjac:
+                    jaclist.append(nljac)
+
+        if len(jaclist) == 2:
+            jnames = [' LN Jac: ', ' NL Jac: ']
+        elif lnjac is not None:
+            if lnjac is nljac:
+                jnames = [' Jac: ']
+            else:
+                jnames = [' LN Jac: ']
+        elif nljac is not None:
+            jnames = [' NL Jac: ']
+        else:
+            jnames = []
+
+        info['jacs'] = [(jname, type(jac).__name__) for jname, jac in zip(jnames, jaclist)]
+
+    if approx and 'approx' not in info:
+        if s._approx_schemes:
+            napprox = sum(1 for sjac in itervalues(s._subjacs_info) if sjac.get('method'))
+            info['approx'] = (list(s._approx_schemes), napprox, len(s._subjacs_info))
+        else:
+            info['approx'] = None
+
+    return info
+
+
 def tree(top, show_solvers=True, show_jacs=True, show_colors=True, show_approx=True,
          filter=None, show_sizes=False, max_depth=0, rank=0, stream=sys.stdout):
     """
@@ -172,11 +248,26 @@ def tree(top, show_solvers=True, show_jacs=True, show_colors=True, show_approx=T
     """
     cprint, Fore, Back, Style = _get_color_printer(stream, show_colors, rank=rank)
 
+    # nothing is displayed on other ranks, so don't bother building the tree there
+    if MPI and MPI.COMM_WORLD.rank != rank:
+        return
+
+    reset = Style.RESET_ALL
+    group_color = Fore.GREEN + Style.BRIGHT
+    comp_color = Fore.CYAN + Style.BRIGHT
+    impl_color = Back.CYAN + Fore.BLACK + Style.BRIGHT
+    size_color = Fore.RED + Style.BRIGHT
+    info_color = Fore.MAGENTA + Style.BRIGHT
+    dist_color = Fore.MAGENTA
+
+    # build up the full tree as a list of strings and write it out all at once at the end
+    lines = []
+
     tab = 0
     if isinstance(top, Problem):
         if filter is None:
-            cprint('Driver: ', color=Fore.CYAN + Style.BRIGHT)
-            cprint(type(top.driver).__name__, color=Fore.MAGENTA, end='\n')
+            lines.append('%sDriver: %s%s%s%s\n' % (comp_color, reset, dist_color,
+                                                   type(top.driver).__name__, reset))
             tab += 1
         top = top.model
 
@@ -193,84 +284,50 @@ def tree(top, show_solvers=True, show_jacs=True, show_colors=True, show_approx=T
             continue
 
         indent = '    ' * (depth + tab)
-        cprint(indent, end='')
+        lines.append(indent)
 
-        info = ''
         if isinstance(s, Group):
-            cprint("%s " % type(s).__name__, color=Fore.GREEN + Style.BRIGHT)
-            cprint("%s" % s.name)
+            colr = group_color
+        elif isinstance(s, ImplicitComponent):
+            colr = impl_color
         else:
-            if isinstance(s, ImplicitComponent):
-                colr = Back.CYAN + Fore.BLACK + Style.BRIGHT
-            else:
-                colr = Fore.CYAN + Style.BRIGHT
-            cprint("%s " % type(s).__name__, color=colr)
-            cprint("%s" % s.name)
-            if s.options['distributed']:
-                cprint(" (distributed)", color=Fore.MAGENTA)
+            colr = comp_color
+        lines.append('%s%s %s%s' % (colr, type(s).__name__, reset, s.name))
+        if not isinstance(s, Group) and s.options['distributed']:
+            lines.append('%s (distributed)%s' % (dist_color, reset))
 
         # FIXME: these sizes could be wrong under MPI
         if show_sizes:
-            cprint(" (%d / %d)" % (s._inputs._data.size, s._outputs._data.size),
-                color=Fore.RED + Style.BRIGHT)
+            lines.append('%s (%d / %d)%s' % (size_color, s._inputs._data.size,
+                                             s._outputs._data.size, reset))
 
         if show_solvers:
             lnsolver = type(s.linear_solver).__name__
             nlsolver = type(s.nonlinear_solver).__name__
 
             if s.linear_solver is not None and lnsolver != "LinearRunOnce":
-                cprint("  LN: ")
-                cprint(lnsolver, color=Fore.MAGENTA + Style.BRIGHT)
+                lines.append('  LN: %s%s%s' % (info_color, lnsolver, reset))
             if s.nonlinear_solver is not None and nlsolver != "NonlinearRunOnce":
-                cprint("  NL: ")
-                cprint(nlsolver, color=Fore.MAGENTA + Style.BRIGHT)
-
-        if show_jacs:
-            jacs = []
-            lnjac = nljac = None
-            if s._assembled_jac is not None:
-                lnjac = s._assembled_jac
-                jacs.append(lnjac)
-            if s.nonlinear_solver is not None:
-                jacsolvers = list(s.nonlinear_solver._assembled_jac_solver_iter())
-                if jacsolvers:
-                    nljac = jacsolvers[0]._assembled_jac
-                    if nljac is not lnjac:
-                        jacs.append(nljac)
-
-            if len(jacs) == 2:
-                jnames = [' LN Jac: ', ' NL Jac: ']
-            elif lnjac is not None:
-                if lnjac is nljac:
-                    jnames = [' Jac: ']
-                else:
-                    jnames = [' LN Jac: ']
-            elif nljac is not None:
-                jnames = [' NL Jac: ']
-            else:
-                jnames = []
-
-            for jname, jac in zip(jnames, jacs):
-                cprint(jname)
-                cprint(type(jac).__name__, color=Fore.MAGENTA + Style.BRIGHT)
-
-        if show_approx and s._approx_schemes:
-            approx_keys = set()
-            keys = set()
-            for k, sjac in iteritems(s._subjacs_info):
-                if 'method' in sjac and sjac['method']:
-                    approx_keys.add(k)
-                else:
-                    keys.add(k)
-            diff = approx_keys - keys
-            cprint("  APPROX: ", color=Fore.MAGENTA + Style.BRIGHT)
-            cprint("%s (%d of %d)" % (list(s._approx_schemes), len(diff), len(s._subjacs_info)))
-
-        cprint('', end='\n')
+                lines.append('  NL: %s%s%s' % (info_color, nlsolver, reset))
+
+        if show_jacs or show_approx:
+            info = _get_debug_info(s, show_jacs, show_approx)
+
+            if show_jacs:
+                for jname, jtype in info['jacs']:
+                    lines.append('%s%s%s%s' % (jname, info_color, jtype, reset))
+
+            if show_approx and info['approx'] is not None:
+                lines.append('%s  APPROX: %s%s (%d of %d)' % ((info_color, reset) +
+                                                              info['approx']))
+
+        lines.append('\n')
 
         vindent = indent + '  '
         for name, val in ret:
-            cprint("%s%s: %s\n" % (vindent, name, val))
+            lines.append("%s%s: %s\n" % (vindent, name, val))
+
+    cprint(''.join(lines))
 
 
 def _get_printer(comm, stream):
@@ -284,6 +341,60 @@ def _get_printer(comm, stream):
     return p
 
 
+def _tree_gather(comm, obj, merge):
+    """
+    Gather obj from all procs onto rank 0 using a binary tree.
+
+    Objects are combined pairwise using merge as they move up the tree, so rank 0 only
+    receives log2(comm.size) messages instead of comm.size - 1.
+
+    Parameters
+    ----------
+    comm : MPI.Comm
+        The communicator.
+    obj : object
+        The picklable local object.
+    merge : function(object, object)
+        Function that combines two objects into one.
+
+    Returns
+    -------
+    object or None
+        The fully merged object on rank 0, None on all other ranks.
+    """
+    rank = comm.rank
+    step = 1
+    while step < comm.size:
+        if rank & step:
+            comm.send(obj, dest=rank - step)
+            return None
+        if rank + step < comm.size:
+            obj = merge(obj, comm.recv(source=rank + step))
+        step <<= 1
+
+    return obj
+
+
+def _merge_summary_data(data1, data2):
+    """
+    Combine two (max_depth, set, set, ...) tuples collected by config_summary.
+
+    Parameters
+    ----------
+    data1 : tuple
+        Max tree depth followed by sets of system names, group names, and linear and
+        nonlinear solvers.
+    data2 : tuple
+        Another tuple of the same form.
+
+    Returns
+    -------
+    tuple
+        The larger of the two max depths followed by the unions of the corresponding sets.
+    """
+    return (max(data1[0], data2[0]),) + tuple(s1 | s2 for s1, s2 in zip(data1[1:], data2[1:]))
+
+
 def config_summary(problem, stream=sys.stdout):
     """
     Prints various high level statistics about the model structure.
@@ -298,41 +409,43 @@ def config_summary(problem, stream=sys.stdout):
     model = problem.model
     meta = model._var_allprocs_abs2meta
     locsystems = list(model.system_iter(recurse=True, include_self=True))
-    locgroups = [s for s in locsystems if isinstance(s, Group)]
 
-    grpnames = [s.pathname for s in locgroups]
+    grpnames = [s.pathname for s in locsystems if isinstance(s, Group)]
     sysnames = [s.pathname for s in locsystems]
-    ln_solvers = [(s.pathname, type(s.linear_solver).__name__) for s in locsystems
-                              if s.linear_solver is not None]
-    nl_solvers = [(s.pathname, type(s.nonlinear_solver).__name__) for s in locsystems
-                         if s.nonlinear_solver is not None]
 
-    max_depth = max([len(name.split('.')) for name in sysnames])
+    max_depth = max(len(name.split('.')) for name in sysnames)
     setup_done = problem._setup_status == 2
 
-    if problem.comm.size > 1:
-        local_max = np.array([max_depth])
-        global_max_depth = np.zeros(1, dtype=int)
-        problem.comm.Allreduce(local_max, global_max_depth, op=MPI.MAX)
-
-        proc_names = problem.comm.gather((sysnames, grpnames, ln_solvers, nl_solvers), root=0)
-        grpnames = set()
-        sysnames = set()
-        ln_solvers = set()
-        nl_solvers = set()
-        if proc_names is not None:
-            for systems, grps, lnsols, nlsols in proc_names:
-                sysnames.update(systems)
-                grpnames.update(grps)
-                ln_solvers.update(lnsols)
-                nl_solvers.update(nlsols)
-    else:
-        global_max_depth = max_depth
-        ln_solvers = set(ln_solvers)
-        nl_solvers = set(nl_solvers)
+    if setup_done:
+        # these are collective under MPI, so every rank must call them before the non-root
+        # ranks return below.
+        desvars = model.get_design_vars()
+        cons = model.get_constraints()
+        objs = model.get_objectives()
 
-    ln_solvers = Counter([sname for _, sname in ln_solvers])
-    nl_solvers = Counter([sname for _, sname in nl_solvers])
+    if problem.comm.size == 1:
+        # each local system is only visited once, so solvers can be counted directly
+        global_max_depth = max_depth
+        ln_solvers = Counter(type(s.linear_solver).__name__ for s in locsystems
+                             if s.linear_solver is not None)
+        nl_solvers = Counter(type(s.nonlinear_solver).__name__ for s in locsystems
+                             if s.nonlinear_solver is not None)
+    else:
+        # systems may be duplicated across procs, so solvers are keyed by system pathname
+        # to avoid counting them more than once.
+        ln_solvers = set((s.pathname, type(s.linear_solver).__name__) for s in locsystems
+                         if s.linear_solver is not None)
+        nl_solvers = set((s.pathname, type(s.nonlinear_solver).__name__) for s in locsystems
+                         if s.nonlinear_solver is not None)
+        summary = _tree_gather(problem.comm,
+                               (max_depth, set(sysnames), set(grpnames), ln_solvers, nl_solvers),
+                               _merge_summary_data)
+        if summary is None:  # not rank 0, so nothing will be printed
+            return
+        global_max_depth, sysnames, grpnames, ln_solvers, nl_solvers = summary
+
+        ln_solvers = Counter(sname for _, sname in ln_solvers)
+        nl_solvers = Counter(sname for _, sname in nl_solvers)
 
     # this gives us a printer that only prints on rank 0
     printer = _get_printer(problem.comm, stream)
@@ -344,45 +457,39 @@ def config_summary(problem, stream=sys.stdout):
     printer()
 
     if setup_done:
-        desvars = model.get_design_vars()
         printer("Design variables:        %5d   Total size: %8d" %
                 (len(desvars), sum(d['size'] for d in desvars.values())))
 
-        con_nonlin_eq = {}
-        con_nonlin_ineq = {}
-        con_linear_eq = {}
-        con_linear_ineq = {}
-        for con, vals in iteritems(model.get_constraints()):
+        # (name, size) of each constraint, split by kind
+        con_nonlin_eq = []
+        con_nonlin_ineq = []
+        con_linear_eq = []
+        con_linear_ineq = []
+        for con, vals in iteritems(cons):
             if vals['linear']:
-                if vals['equals'] is not None:
-                    con_linear_eq[con] = vals
-                else:
-                    con_linear_ineq[con] = vals
+                kind = con_linear_eq if vals['equals'] is not None else con_linear_ineq
             else:
-                if vals['equals'] is not None:
-                    con_nonlin_eq[con]= vals
-                else:
-                    con_nonlin_ineq[con]= vals
+                kind = con_nonlin_eq if vals['equals'] is not None else con_nonlin_ineq
+            kind.append((con, vals['size']))
 
-        con_nonlin = con_nonlin_eq.copy()
-        con_nonlin.update(con_nonlin_ineq)
-        con_linear = con_linear_eq.copy()
-        con_linear.update(con_linear_ineq)
+        nonlin_eq_size = sum(sz for _, sz in con_nonlin_eq)
+        nonlin_ineq_size = sum(sz for _, sz in con_nonlin_ineq)
+        linear_eq_size = sum(sz for _, sz in con_linear_eq)
+        linear_ineq_size = sum(sz for _, sz in con_linear_ineq)
 
         printer("\nNonlinear Constraints:   %5d   Total size: %8d" %
-                (len(con_nonlin), sum(d['size'] for d in con_nonlin.values())))
+                (len(con_nonlin_eq) + len(con_nonlin_ineq), nonlin_eq_size + nonlin_ineq_size))
         printer("    equality:            %5d               %8d" %
-                (len(con_nonlin_eq), sum(d['size'] for d in con_nonlin_eq.values())))
+                (len(con_nonlin_eq), nonlin_eq_size))
         printer("    inequality:          %5d               %8d" %
-                (len(con_nonlin_ineq), sum(d['size'] for d in con_nonlin_ineq.values())))
+                (len(con_nonlin_ineq), nonlin_ineq_size))
         printer("\nLinear Constraints:      %5d   Total size: %8d" %
-                (len(con_linear), sum(d['size'] for d in con_linear.values())))
+                (len(con_linear_eq) + len(con_linear_ineq), linear_eq_size + linear_ineq_size))
         printer("    equality:            %5d               %8d" %
-                (len(con_linear_eq), sum(d['size'] for d in con_linear_eq.values())))
+                (len(con_linear_eq), linear_eq_size))
         printer("    inequality:          %5d               %8d" %
-                (len(con_linear_ineq), sum(d['size'] for d in con_linear_ineq.values())))
+                (len(con_linear_ineq), linear_ineq_size))
 
-        objs = model.get_objectives()
         printer("\nObjectives:              %5d   Total size: %8d" %
                 (len(objs), sum(d['size'] for d in objs.values())))
 
@@ -450,35 +557,57 @@ def profiling(outname='prof.out'):
     prof.dump_stats(outname)
 
 
+def _jac_max_diff(key, diff, absref, rel_trigger):
+    """
+    Return the max difference for a sub-jacobian and whether it is absolute or relative.
+
+    Entries of diff where absref exceeds rel_trigger are converted in place to relative diffs.
+
+    Parameters
+    ----------
+    key : tuple
+        The (of, wrt) key of the sub-jacobian.
+    diff : ndarray
+        Absolute difference between the sub-jacobian and its reference. Modified in place.
+    absref : ndarray
+        Absolute value of the reference sub-jacobian.
+    rel_trigger : float
+        Reference magnitude above which a relative difference is used.
+
+    Returns
+    -------
+    tuple
+        (key, max_diff, 'rel' or 'abs').
+    """
+    rel_idxs = np.nonzero(absref > rel_trigger)
+    diff[rel_idxs] /= absref[rel_idxs]
+
+    max_diff_idx = np.argmax(diff)
+    max_diff = diff.flat[max_diff_idx]
+
+    # max diff is rel if it came from an entry where the reference exceeds the trigger
+    if absref.flat[max_diff_idx] > rel_trigger:
+        return (key, max_diff, 'rel')
+    return (key, max_diff, 'abs')
+
+
 def compare_jacs(Jref, J, rel_trigger=1.0):
     results = []
 
-    for key in set(J).union(Jref):
-        if key in J:
-            subJ = J[key]
-        else:
-            subJ = np.zeros(Jref[key].shape)
-
+    for key, subJ in iteritems(J):
         if key in Jref:
             subJref = Jref[key]
+            results.append(_jac_max_diff(key, np.abs(subJ - subJref), np.abs(subJref),
+                                         rel_trigger))
         else:
-            subJref = np.zeros(J[key].shape)
-
-        diff = np.abs(subJ - subJref)
-        absref = np.abs(subJref)
-        rel_idxs = np.nonzero(absref > rel_trigger)
-        diff[rel_idxs] /= absref[rel_idxs]
+            # reference is all zeros, so there are no relative diffs
+            results.append((key, np.abs(subJ).max(), 'abs'))
 
-        max_diff_idx = np.argmax(diff)
-        max_diff = diff.flatten()[max_diff_idx]
-
-        # now determine if max diff is abs or rel
-        diff[:] = 0.0
-        diff[rel_idxs] = 1.0
-        if diff.flatten()[max_diff_idx] > 0.0:
-            results.append((key, max_diff, 'rel'))
-        else:
-            results.append((key, max_diff, 'abs'))
+    for key, subJref in iteritems(Jref):
+        if key not in J:
+            # J is all zeros, so diff is just the magnitude of the reference
+            absref = np.abs(subJref)
+            results.append(_jac_max_diff(key, absref.copy(), absref, rel_trigger))
 
     return results
 
@@ -524,6 +653,51 @@ def trace_mpi(fname='mpi_trace', skip=(), flush=True):
                     file=outfile, flush=True)
 
 
+    # maps id(obj) to (weakref(obj), state, msginfo, comm size) so that the msginfo property
+    # isn't recomputed on every event.  'state' holds the attributes that msginfo and comm size
+    # depend on so that entries cached before or during setup are refreshed when they change.
+    obj_info = {}
+
+    def _evict(key, ref):
+        # only remove the entry if it still belongs to the dead object, since its id may
+        # already have been reused.
+        entry = obj_info.get(key)
+        if entry is not None and entry[0] is ref:
+            del obj_info[key]
+
+    def _get_obj_info(obj):
+        try:
+            state = (getattr(obj, 'pathname', None), getattr(obj, 'name', None),
+                     getattr(obj, '_system', None), getattr(obj, 'comm', None))
+        except:
+            state = None
+        key = id(obj)
+        try:
+            ref, old_state, pname, commsize = obj_info[key]
+            if ref() is obj and old_state == state:
+                return pname, commsize
+        except KeyError:
+            pass
+
+        pname = None
+        commsize = ''
+        try:
+            pname = obj.msginfo
+        except:
+            return pname, commsize  # probably not fully initialized yet, so don't cache
+        try:
+            commsize = obj.comm.size
+        except:
+            pass
+        try:
+            ref = weakref.ref(obj, lambda r, key=key: _evict(key, r))
+        except TypeError:  # obj can't be weakly referenced, so don't cache
+            pass
+        else:
+            obj_info[key] = (ref, state, pname, commsize)
+
+        return pname, commsize
+
     def _mpi_trace_callback(frame, event, arg):
         pname = None
         commsize = ''
@@ -532,14 +706,7 @@ def trace_mpi(fname='mpi_trace', skip=(), flush=True):
                 if frame.f_code.co_name in skip:
                     return
                 if 'self' in frame.f_locals:
-                    try:
-                        pname = frame.f_locals['self'].msginfo
-                    except:
-                        pass
-                    try:
-                        commsize = frame.f_locals['self'].comm.size
-                    except:
-                        pass
+                    pname, commsize = _get_obj_info(frame.f_locals['self'])
                 if pname is not None:
                     if not stack or pname != stack[-1][0]:
                         stack.append([pname, 1])
@@ -554,14 +721,7 @@ def trace_mpi(fname='mpi_trace', skip=(), flush=True):
                 if frame.f_code.co_name in skip:
                     return
                 if 'self' in frame.f_locals:
-                    try:
-                        pname = frame.f_locals['self'].msginfo
-                    except:
-                        pass
-                    try:
-                        commsize = frame.f_locals['self'].comm.size
-                    except:
-                        pass
+                    pname, commsize = _get_obj_info(frame.f_locals['self'])
                 print('   ' * len(stack), '<--', frame.f_code.co_name, "%s:%d" %
                       (frame.f_code.co_filename, frame.f_code.co_firstlineno),
                       file=outfile, flush=flush)
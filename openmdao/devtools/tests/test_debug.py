@@ -1,11 +1,13 @@
 import unittest
 
+import numpy as np
 from six import StringIO
 
-from openmdao.api import Problem
+from openmdao.api import Problem, IndepVarComp, DirectSolver
+from openmdao.test_suite.components.paraboloid import Paraboloid
 from openmdao.test_suite.scripts.circle_opt import CircleOpt
 
-from openmdao.devtools.debug import config_summary
+from openmdao.devtools.debug import config_summary, compare_jacs, tree
 
 
 class TestDebug(unittest.TestCase):
@@ -51,6 +53,55 @@ class TestDebug(unittest.TestCase):
             self.assertEqual(text[i], expected[i],
                             '\nExpected: %s\nReceived: %s\n' % (expected[i], text[i]))
 
+    def test_compare_jacs(self):
+        Jref = {
+            ('y', 'x'): np.array([[10.0, 0.5], [0.1, -4.0]]),
+            ('y', 'z'): np.array([[0.5, 3.0]]),
+        }
+        J = {
+            ('y', 'x'): np.array([[11.0, 0.5], [0.3, -4.0]]),
+            ('y', 'w'): np.array([[0.0, -2.0]]),
+        }
+
+        results = {key: (max_diff, kind) for key, max_diff, kind in compare_jacs(Jref, J)}
+
+        self.assertEqual(sorted(results), [('y', 'w'), ('y', 'x'), ('y', 'z')])
+
+        max_diff, kind = results['y', 'x']
+        self.assertAlmostEqual(max_diff, 0.2)
+        self.assertEqual(kind, 'abs')
+
+        # only in J, so diffs are absolute
+        self.assertEqual(results['y', 'w'], (2.0, 'abs'))
+
+        # only in Jref, so the large entry is a 100% relative diff
+        self.assertEqual(results['y', 'z'], (1.0, 'rel'))
+
+    def test_tree_approx_and_jacs(self):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', 1.0))
+        comp = model.add_subsystem('comp', Paraboloid())
+        model.connect('p.x', 'comp.x')
+        comp.declare_partials('*', '*', method='fd')
+        prob.setup()
+        prob.final_setup()
+
+        stream = StringIO()
+        tree(prob, show_colors=False, stream=stream)
+        lines = stream.getvalue().split('\n')
+        self.assertEqual(lines[3], "        Paraboloid comp  APPROX: ['fd'] (2 of 3)")
+
+        # jacobian info is cached, but must be updated after the next setup
+        model.linear_solver = DirectSolver(assemble_jac=True)
+        prob.setup()
+        prob.final_setup()
+
+        stream = StringIO()
+        tree(prob, show_colors=False, stream=stream)
+        lines = stream.getvalue().split('\n')
+        self.assertEqual(lines[1], "    Group   LN: DirectSolver LN Jac: CSCJacobian")
+
 
 if __name__ == "__main__":
     unittest.main()
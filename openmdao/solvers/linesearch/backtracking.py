@@ -231,6 +231,8 @@ class ArmijoGoldsteinLS(LinesearchSolver):
         # From definition of Newton's method one full step should drive the linearized residuals
         # to 0, hence the directional derivative is equal to the initial function value.
         self._dir_derivative = -phi0
+        # Slope parameter is constant for the whole line search, so look it up only once.
+        self._c1 = self.options['c']
 
         # Initial step length based on the input step length parameter
         u.add_scal_vec(alpha, du)
@@ -327,7 +329,7 @@ class ArmijoGoldsteinLS(LinesearchSolver):
         method = method.lower()
         fval0 = self._phi0
         df_dalpha = self._dir_derivative
-        c1 = self.options['c']
+        c1 = self._c1
         alpha = self.alpha
         if method == 'armijo':
             return fval <= fval0 + c1 * alpha * df_dalpha
@@ -744,6 +744,50 @@ class CompAtan(om.ImplicitComponent):
         jacobian['y', 'x'] = 1.0
 
 
+class TestArmijoGoldsteinLSStep(unittest.TestCase):
+
+    def test_backtrack_step_equivalence(self):
+        # Backtracking moves u with a single add_scal_vec per iteration. Make sure the result
+        # matches the two-step form of retracting the previous step and applying the new one.
+        class SnapshotLS(om.ArmijoGoldsteinLS):
+            def _iter_initialize(self):
+                phi = super(SnapshotLS, self)._iter_initialize()
+                system = self._system()
+                self.du0 = system._vectors['output']['linear']._data.copy()
+                self.u0 = system._outputs._data - self.alpha * self.du0
+                return phi
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('px', om.IndepVarComp('x', -100.0))
+        model.add_subsystem('comp', CompAtan())
+        model.connect('px.x', 'comp.x')
+
+        newton = model.nonlinear_solver = om.NewtonSolver()
+        newton.options['maxiter'] = 1
+        newton.options['err_on_non_converge'] = False
+        model.linear_solver = om.DirectSolver()
+
+        ls = newton.linesearch = SnapshotLS(bound_enforcement='vector', maxiter=3, rho=0.3, c=1.0)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob['comp.y'] = 12.0
+        prob.run_model()
+
+        self.assertTrue(ls._iter_count > 1)
+
+        alpha = ls.options['alpha']
+        expected = ls.u0 + alpha * ls.du0
+        for i in range(1, ls._iter_count):
+            expected -= alpha * ls.du0
+            alpha *= ls.options['rho']
+            expected += alpha * ls.du0
+
+        assert_rel_error(self, model._outputs._data, expected, 1e-15)
+
+
 class TestFeatureLineSearch(unittest.TestCase):
 
     def test_feature_specification(self):
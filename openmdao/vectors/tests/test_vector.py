@@ -43,6 +43,10 @@ class TestVector(unittest.TestCase):
 
         self.assertListEqual(outputs, expected, msg='Iter is not returning the expected names')
 
+        # names are cached, but must follow changes to the set of relevant variables
+        p.model._outputs._names = frozenset(['des_vars.v2'])
+        self.assertListEqual(list(p.model._outputs), ['des_vars.v2'])
+
     def test_dot(self):
         p = om.Problem()
         comp = om.IndepVarComp()
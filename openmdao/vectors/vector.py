@@ -56,6 +56,10 @@ class Vector(object):
         Dictionary mapping absolute variable names to the flattened ndarray views.
     _names : set([str, ...])
         Set of variables that are relevant in the current context.
+    _iter_names : tuple
+        Tuple of the form (names, rel_names) where rel_names are the relative names of the
+        variables in names, in order.  Used to avoid recomputing rel_names in __iter__ unless
+        _names has changed.
     _root_vector : Vector
         Pointer to the vector owned by the root system.
     _alloc_complex : Bool
@@ -135,6 +139,7 @@ class Vector(object):
         # self._names will either be equivalent to self._views or to the
         # set of variables relevant to the current matvec product.
         self._names = self._views
+        self._iter_names = (None, ())
 
         self._root_vector = None
         self._data = None
@@ -284,11 +289,17 @@ class Vector(object):
         listiterator
             iterator over the variable names.
         """
-        system = self._system()
-        path = system.pathname
-        idx = len(path) + 1 if path else 0
+        names = self._names
+        cached_names, rel_names = self._iter_names
+        if cached_names is not names:
+            system = self._system()
+            path = system.pathname
+            idx = len(path) + 1 if path else 0
+
+            rel_names = tuple(n[idx:] for n in system._var_abs_names[self._typ] if n in names)
+            self._iter_names = (names, rel_names)
 
-        return (n[idx:] for n in system._var_abs_names[self._typ] if n in self._names)
+        return iter(rel_names)
 
     def __contains__(self, name):
         """